@@ -2,35 +2,337 @@ import boto3
 import os
 import json
 import datetime
+import decimal
+import hashlib
 import logging
+import argparse
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache, partial
+from itertools import chain
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# AWS API calls are I/O-bound, so a thread pool overlaps their round-trips.
+# Each manager shares one pool of this size for all per-resource calls.
+MAX_WORKERS = 32
+
+# Coordinating threads that also make calls: the four steps in main() plus
+# the ECS, ECR and EKS managers
+COORDINATOR_THREADS = 4 + 3
+
+# Shared client settings: a connection pool covering peak concurrency so no
+# connection is discarded, TCP keep-alive on pooled connections and adaptive
+# retries to absorb throttling
+CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_WORKERS + COORDINATOR_THREADS,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# One session for the whole process, so credentials and service models are loaded once
+_SESSION = boto3.session.Session()
+
+_CLIENT_LOCK = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _client(service: str, region: Optional[str] = None):
+    """
+    Returns the shared client for service, creating it on first use.
+    """
+    # Sessions are not thread-safe and clients may first be needed on a worker thread
+    with _CLIENT_LOCK:
+        return _SESSION.client(service, region_name=region, config=CLIENT_CONFIG)
+
+# Describe/List results are cached on disk between runs, keyed by credentials and region
+CACHE_DIR = Path.home() / '.cache' / 'aws-cost-manager'
+INVENTORY_CACHE_TTL = 3600  # 1 hour, for budgets and alarms
+ACCOUNT_ID_CACHE_TTL = 86400  # 24 hours
+
+# Maximum number of services accepted by a single ECS DescribeServices call
+ECS_DESCRIBE_SERVICES_BATCH_SIZE = 10
+
+# Environment tag values of instances stopped by manage_resource_shutdown
+NON_PRODUCTION_ENVIRONMENTS = frozenset({'Development', 'Testing', 'Dev', 'Test'})
+
+# Maximum number of instances accepted by a single EC2 StopInstances call
+STOP_INSTANCES_BATCH_SIZE = 1000
+
+# Cost Explorer service names reported in the container cost summary
+CONTAINER_SERVICES = frozenset({
+    'Amazon Elastic Container Service',
+    'Amazon Elastic Container Registry',
+    'Amazon Elastic Kubernetes Service'
+})
+
+# Lifecycle policy applied to every ECR repository: expire untagged images
+# after 14 days and keep at most 30 release images. Serialized once here
+# rather than per repository.
+ECR_LIFECYCLE_POLICY = {
+    'rules': [
+        {
+            'rulePriority': 1,
+            'description': 'Remove untagged images older than 14 days',
+            'selection': {
+                'tagStatus': 'untagged',
+                'countType': 'sinceImagePushed',
+                'countUnit': 'days',
+                'countNumber': 14
+            },
+            'action': {
+                'type': 'expire'
+            }
+        },
+        {
+            'rulePriority': 2,
+            'description': 'Keep only 30 tagged images',
+            'selection': {
+                'tagStatus': 'tagged',
+                'tagPrefixList': ['v', 'release'],
+                'countType': 'imageCountMoreThan',
+                'countNumber': 30
+            },
+            'action': {
+                'type': 'expire'
+            }
+        }
+    ]
+}
+
+ECR_LIFECYCLE_POLICY_TEXT = json.dumps(ECR_LIFECYCLE_POLICY)
+
+# Fields set on every alarm through put_metric_alarm
+ALARM_CONFIG_FIELDS = (
+    'AlarmName', 'MetricName', 'Namespace', 'Dimensions', 'Period',
+    'EvaluationPeriods', 'Threshold', 'ComparisonOperator', 'Statistic',
+    'ActionsEnabled', 'AlarmDescription'
+)
+
+def _chunks(items: list, size: int):
+    """
+    Yields successive slices of at most size items.
+    """
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def _prune_cache_dirs(keep: Path) -> None:
+    """
+    Removes cache directories of other credentials that have not been
+    written to within ACCOUNT_ID_CACHE_TTL, the longest cache lifetime.
+    """
+    cutoff = time.time() - ACCOUNT_ID_CACHE_TTL
+    try:
+        stale = [
+            path for path in CACHE_DIR.iterdir()
+            if path != keep and path.is_dir() and path.stat().st_mtime < cutoff
+        ]
+    except OSError:
+        return  # No cache yet
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+def _cost_period() -> tuple[str, str]:
+    """
+    Returns the (start, end) dates of the current month to date.
+    Uses a single UTC timestamp to match Cost Explorer's billing days.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return now.replace(day=1).strftime('%Y-%m-%d'), now.strftime('%Y-%m-%d')
+
+def _sum_costs_by_service(groups: list) -> list:
+    """
+    Collapses Cost Explorer groups keyed by (service, usage type) into one
+    group per service with the summed cost.
+    """
+    totals = {}
+    for group in groups:
+        service = group['Keys'][0]
+        cost = group['Metrics']['UnblendedCost']
+        amount, unit = totals.get(service, (decimal.Decimal(0), cost['Unit']))
+        totals[service] = (amount + decimal.Decimal(cost['Amount']), unit)
+    return [
+        {
+            'Keys': [service],
+            'Metrics': {'UnblendedCost': {'Amount': format(amount, 'f'), 'Unit': unit}}
+        }
+        for service, (amount, unit) in totals.items()
+    ]
+
+def _canonical_alarm(alarm: dict) -> dict:
+    """
+    Reduces an alarm to the fields set through put_metric_alarm, in a
+    form that compares equal regardless of API response formatting.
+    """
+    canonical = {field: alarm.get(field) for field in ALARM_CONFIG_FIELDS}
+    canonical['Dimensions'] = sorted(
+        canonical['Dimensions'] or [],
+        key=lambda dimension: dimension['Name']
+    )
+    if canonical['Threshold'] is not None:
+        canonical['Threshold'] = float(canonical['Threshold'])
+    return canonical
+
+def _is_positive_int(value) -> bool:
+    """
+    Whether value is an integer of at least 1, excluding booleans.
+    """
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 1
+
+def _validate_lifecycle_policy(policy: dict) -> None:
+    """
+    Sanity-checks the rules of an ECR lifecycle policy for the mistakes ECR
+    would reject, so an edit to the constant fails at import. Raises
+    ValueError describing the first problem found.
+    """
+    priorities = [rule['rulePriority'] for rule in policy['rules']]
+    if not all(_is_positive_int(p) for p in priorities) or len(set(priorities)) != len(priorities):
+        raise ValueError('Lifecycle policy rule priorities must be unique positive integers')
+    
+    for rule in policy['rules']:
+        priority = rule['rulePriority']
+        selection = rule['selection']
+        if rule['action'] != {'type': 'expire'}:
+            raise ValueError(f"Rule {priority} action must be {{'type': 'expire'}}")
+        if (selection['tagStatus'] == 'tagged') != bool(selection.get('tagPrefixList')):
+            raise ValueError(f"Rule {priority} must set tagPrefixList if and only if tagStatus is tagged")
+        if (selection['countType'] == 'sinceImagePushed') != (selection.get('countUnit') == 'days'):
+            raise ValueError(f"Rule {priority} must set countUnit 'days' if and only if countType is sinceImagePushed")
+        if not _is_positive_int(selection['countNumber']):
+            raise ValueError(f"Rule {priority} needs a positive integer countNumber")
+
+def _policy_digest(policy: dict) -> str:
+    """
+    Hashes a policy independent of key order and whitespace, since ECR may
+    return the policy text reformatted.
+    """
+    canonical = json.dumps(policy, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+# Check the lifecycle policy once at import rather than relying on every
+# put_lifecycle_policy call to reject it
+_validate_lifecycle_policy(ECR_LIFECYCLE_POLICY)
+ECR_LIFECYCLE_POLICY_DIGEST = _policy_digest(ECR_LIFECYCLE_POLICY)
+
 class AWSCostManager:
-    def __init__(self, monthly_budget: float, email: str):
+    def __init__(self, monthly_budget: float, email: str, cache_ttl: int = INVENTORY_CACHE_TTL):
         self.monthly_budget = monthly_budget
         self.email = email
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
+        self.cache_ttl = cache_ttl
+        self._cache_locks = {}
+        self._running_instances = None
+        self._running_instances_lock = threading.Lock()
+        # Per-resource calls from every step share this pool, so concurrency
+        # stays within the client connection pools. Only leaf tasks that
+        # never wait on the pool themselves are submitted to it.
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+    @cached_property
+    def cache_dir(self) -> Path:
+        """
+        Cache directory for the current credentials and region, so entries from
+        another account are never reused. Static credentials are keyed by their
+        access key ID. Temporary ones (roles, SSO, instance profiles) rotate that
+        key every session, so they are keyed by profile and credential source.
+        Directories left unused for longer than the longest TTL are pruned.
+        """
+        with _CLIENT_LOCK:
+            credentials = _SESSION.get_credentials()
+        if credentials is None:
+            source = 'anonymous'
+        else:
+            frozen = credentials.get_frozen_credentials()
+            if frozen.token:
+                source = f'{_SESSION.profile_name}:{credentials.method}'
+            else:
+                source = f'key:{frozen.access_key}'
+        identity = f'{source}:{_SESSION.region_name or "default"}'
+        cache_dir = CACHE_DIR / hashlib.sha256(identity.encode()).hexdigest()[:16]
+        _prune_cache_dirs(keep=cache_dir)
+        return cache_dir
+
+    # Clients are created on first use, so a run only pays for the services it touches
+    @cached_property
+    def budgets(self):
+        return _client('budgets')
+
+    @cached_property
+    def ec2(self):
+        return _client('ec2')
+
+    @cached_property
+    def cloudwatch(self):
+        return _client('cloudwatch')
+
+    @cached_property
+    def ce(self):
+        return _client('ce')
+
+    @cached_property
+    def ecs(self):
+        return _client('ecs')
+
+    @cached_property
+    def ecr(self):
+        return _client('ecr')
+
+    @cached_property
+    def eks(self):
+        return _client('eks')
+
+    @cached_property
+    def account_id(self) -> str:
+        """
+        Looks up the account ID of the current credentials, cached on disk.
+        """
+        return self._cached(
+            'account-id',
+            ACCOUNT_ID_CACHE_TTL,
+            lambda: _client('sts').get_caller_identity()['Account']
         )
-        self.logger = logging.getLogger(__name__)
-        
-        try:
-            # Initialize standard AWS clients
-            self.budgets = boto3.client('budgets')
-            self.ec2 = boto3.client('ec2')
-            self.cloudwatch = boto3.client('cloudwatch')
-            self.account_id = boto3.client('sts').get_caller_identity()['Account']
+
+    def _cached(self, key: str, ttl: int, fetch):
+        """
+        Returns the cached result for key if it is younger than ttl seconds.
+        Otherwise calls fetch() and stores its JSON-serializable result.
+        Concurrent callers for the same key wait for a single fetch.
+        """
+        path = self.cache_dir / f'{key}.json'
+        with self._cache_locks.setdefault(key, threading.Lock()):
+            try:
+                if path.stat().st_mtime > time.time() - ttl:
+                    return json.loads(path.read_text())
+            except (OSError, ValueError):
+                pass  # Missing or unreadable cache entry, fetch a fresh one
             
-            # Initialize container service clients
-            self.ecs = boto3.client('ecs')
-            self.ecr = boto3.client('ecr')
-            self.eks = boto3.client('eks')
-        except Exception as e:
-            self.logger.error(f"Failed to initialize AWS clients: {str(e)}")
-            raise
+            value = fetch()
+            
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile('w', dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+                    json.dump(value, f, default=str)
+                # Atomic rename so concurrent readers never see a partial file
+                os.replace(f.name, path)
+            except OSError as e:
+                logger.warning("Failed to write cache entry %s: %s", key, e)
+            
+            return value
+
+    def _invalidate(self, key: str) -> None:
+        """
+        Drops the cached result for key after a write has made it stale.
+        """
+        try:
+            (self.cache_dir / f'{key}.json').unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to invalidate cache entry %s: %s", key, e)
 
     def create_or_update_budget_alert(self) -> bool:
         """
@@ -42,16 +344,14 @@ class AWSCostManager:
             
             # Check if budget already exists
             try:
-                existing_budgets = self.budgets.describe_budgets(
-                    AccountId=self.account_id
-                )['Budgets']
-                
-                existing_budget = next(
-                    (b for b in existing_budgets if b['BudgetName'] == budget_name),
-                    None
+                existing_budget_names = self._cached(
+                    'budgets',
+                    self.cache_ttl,
+                    self._fetch_budget_names
                 )
+                existing_budget = budget_name in existing_budget_names
             except ClientError:
-                existing_budget = None
+                existing_budget = False
 
             # Define the budget configuration
             budget = {
@@ -90,7 +390,7 @@ class AWSCostManager:
                     AccountId=self.account_id,
                     NewBudget=budget
                 )
-                self.logger.info(f"Updated existing budget: {budget_name}")
+                logger.info("Updated existing budget: %s", budget_name)
             else:
                 # Create new budget
                 self.budgets.create_budget(
@@ -98,137 +398,240 @@ class AWSCostManager:
                     Budget=budget,
                     NotificationsWithSubscribers=notifications
                 )
-                self.logger.info(f"Created new budget: {budget_name}")
+                self._invalidate('budgets')
+                logger.info("Created new budget: %s", budget_name)
             
             return True
             
         except ClientError as e:
-            self.logger.error(f"Failed to manage budget: {str(e)}")
+            # The cached budget list may be what made the write fail
+            self._invalidate('budgets')
+            logger.error("Failed to manage budget: %s", e)
             return False
 
+    def _fetch_budget_names(self) -> list:
+        """
+        Lists the names of all budgets in the account.
+        """
+        pages = self.budgets.get_paginator('describe_budgets').paginate(
+            AccountId=self.account_id
+        )
+        return [
+            budget['BudgetName']
+            for budget in chain.from_iterable(page.get('Budgets', []) for page in pages)
+        ]
+
     def manage_resource_monitoring(self) -> bool:
         """
         Sets up or updates CloudWatch alarms for resource monitoring.
-        Checks existing alarms before creating new ones.
+        Compares existing alarms to the desired configuration and only writes the differences.
         """
         try:
             # Get all running EC2 instances
-            instances = self.ec2.describe_instances(
-                Filters=[{
-                    'Name': 'instance-state-name',
-                    'Values': ['running']
-                }]
-            )
+            instance_ids = [instance['InstanceId'] for instance in self.get_running_instances()]
             
             # Get existing alarms
-            existing_alarms = self.cloudwatch.describe_alarms(
-                AlarmNamePrefix='LowCPU-'
-            )['MetricAlarms']
-            existing_alarm_names = {alarm['AlarmName'] for alarm in existing_alarms}
+            existing_alarms_by_name = self._cached(
+                'cpu-alarm-configs',
+                self.cache_ttl,
+                partial(self._fetch_alarms, 'LowCPU-')
+            )
             
             # Track instances that need alarms
-            needed_alarms = set()
+            needed_alarms = {
+                f'LowCPU-{instance_id}': self._cpu_alarm_config(instance_id)
+                for instance_id in instance_ids
+            }
+            changes = list(self._executor.map(
+                lambda alarm_config: self._ensure_alarm(existing_alarms_by_name, **alarm_config),
+                needed_alarms.values()
+            ))
             
-            for reservation in instances['Reservations']:
-                for instance in reservation['Instances']:
-                    instance_id = instance['InstanceId']
-                    alarm_name = f'LowCPU-{instance_id}'
-                    needed_alarms.add(alarm_name)
-                    
-                    alarm_config = {
-                        'AlarmName': alarm_name,
-                        'MetricName': 'CPUUtilization',
-                        'Namespace': 'AWS/EC2',
-                        'Dimensions': [{
-                            'Name': 'InstanceId',
-                            'Value': instance_id
-                        }],
-                        'Period': 3600,
-                        'EvaluationPeriods': 24,
-                        'Threshold': 10.0,
-                        'ComparisonOperator': 'LessThanThreshold',
-                        'Statistic': 'Average',
-                        'ActionsEnabled': True,
-                        'AlarmDescription': f'CPU utilization is below 10% for instance {instance_id}'
-                    }
-                    
-                    if alarm_name in existing_alarm_names:
-                        # Update existing alarm
-                        self.cloudwatch.put_metric_alarm(**alarm_config)
-                        self.logger.info(f"Updated alarm for instance {instance_id}")
-                    else:
-                        # Create new alarm
-                        self.cloudwatch.put_metric_alarm(**alarm_config)
-                        self.logger.info(f"Created new alarm for instance {instance_id}")
+            for instance_id, change in zip(instance_ids, changes):
+                if change == 'created':
+                    logger.info("Created new alarm for instance %s", instance_id)
+                elif change == 'updated':
+                    logger.info("Updated alarm for instance %s", instance_id)
             
             # Clean up obsolete alarms
-            obsolete_alarms = existing_alarm_names - needed_alarms
+            existing_alarm_names = frozenset(existing_alarms_by_name)
+            obsolete_alarms = existing_alarm_names - frozenset(needed_alarms)
             if obsolete_alarms:
                 self.cloudwatch.delete_alarms(
                     AlarmNames=list(obsolete_alarms)
                 )
-                self.logger.info(f"Cleaned up {len(obsolete_alarms)} obsolete alarms")
+                logger.info("Cleaned up %d obsolete alarms", len(obsolete_alarms))
+            
+            if any(changes) or obsolete_alarms:
+                self._invalidate('cpu-alarm-configs')
             
             return True
             
         except ClientError as e:
-            self.logger.error(f"Failed to manage resource monitoring: {str(e)}")
+            # Some alarms may have been written before the failure
+            self._invalidate('cpu-alarm-configs')
+            logger.error("Failed to manage resource monitoring: %s", e)
             return False
 
+    def get_running_instances(self) -> list:
+        """
+        Lists the ID and tags of every running EC2 instance. Fetched live once
+        per manager and shared by monitoring and shutdown, never read from the
+        disk cache, so shutdown acts on the current fleet. Concurrent callers
+        wait for a single fetch.
+        """
+        with self._running_instances_lock:
+            if self._running_instances is None:
+                self._running_instances = self._fetch_running_instances()
+            return self._running_instances
+
+    def _invalidate_running_instances(self) -> None:
+        """
+        Drops the running-instance list so the next caller fetches it again.
+        """
+        with self._running_instances_lock:
+            self._running_instances = None
+
+    def _fetch_running_instances(self) -> list:
+        """
+        Retrieves the ID and tags of every running EC2 instance.
+        """
+        pages = self.ec2.get_paginator('describe_instances').paginate(
+            Filters=[{
+                'Name': 'instance-state-name',
+                'Values': ['running']
+            }]
+        )
+        instances = chain.from_iterable(
+            reservation['Instances']
+            for page in pages
+            for reservation in page['Reservations']
+        )
+        return [
+            {'InstanceId': instance['InstanceId'], 'Tags': instance.get('Tags', [])}
+            for instance in instances
+        ]
+
+    def _fetch_alarms(self, prefix: Optional[str] = None) -> dict:
+        """
+        Retrieves all metric alarms, or those whose name starts with prefix,
+        keyed by alarm name.
+        """
+        params = {'AlarmTypes': ['MetricAlarm']}
+        if prefix:
+            params['AlarmNamePrefix'] = prefix
+        pages = self.cloudwatch.get_paginator('describe_alarms').paginate(**params)
+        return {
+            alarm['AlarmName']: _canonical_alarm(alarm)
+            for alarm in chain.from_iterable(page['MetricAlarms'] for page in pages)
+        }
+
+    def _cpu_alarm_config(self, instance_id: str) -> dict:
+        """
+        Builds the low CPU alarm configuration for a single EC2 instance.
+        """
+        return {
+            'AlarmName': f'LowCPU-{instance_id}',
+            'MetricName': 'CPUUtilization',
+            'Namespace': 'AWS/EC2',
+            'Dimensions': [{
+                'Name': 'InstanceId',
+                'Value': instance_id
+            }],
+            'Period': 3600,
+            'EvaluationPeriods': 24,
+            'Threshold': 10.0,
+            'ComparisonOperator': 'LessThanThreshold',
+            'Statistic': 'Average',
+            'ActionsEnabled': True,
+            'AlarmDescription': f'CPU utilization is below 10% for instance {instance_id}'
+        }
+
+    def _ensure_alarm(self, existing_alarms_by_name: dict, **alarm_config) -> Optional[str]:
+        """
+        Creates or updates an alarm unless the existing alarm already matches.
+        Returns 'created' or 'updated' if the alarm was written, otherwise None.
+        """
+        existing = existing_alarms_by_name.get(alarm_config['AlarmName'])
+        if existing is None:
+            # Create new alarm
+            self.cloudwatch.put_metric_alarm(**alarm_config)
+            return 'created'
+        if existing != _canonical_alarm(alarm_config):
+            # Update existing alarm
+            self.cloudwatch.put_metric_alarm(**alarm_config)
+            return 'updated'
+        return None
+
     def manage_resource_shutdown(self) -> bool:
         """
         Manages automated shutdown for non-production resources.
         Only stops instances that are currently running.
         """
         try:
-            # Get only running instances with development or testing tags
-            instances = self.ec2.describe_instances(
-                Filters=[
-                    {
-                        'Name': 'tag:Environment',
-                        'Values': ['Development', 'Testing', 'Dev', 'Test']
-                    },
-                    {
-                        'Name': 'instance-state-name',
-                        'Values': ['running']
-                    }
-                ]
-            )
-            
-            # Collect instances that need to be stopped
-            instance_ids = []
-            for reservation in instances['Reservations']:
-                for instance in reservation['Instances']:
-                    instance_ids.append(instance['InstanceId'])
+            # Collect running instances with development or testing tags
+            instance_ids = [
+                instance['InstanceId']
+                for instance in self.get_running_instances()
+                if any(
+                    tag['Key'] == 'Environment' and tag['Value'] in NON_PRODUCTION_ENVIRONMENTS
+                    for tag in instance['Tags']
+                )
+            ]
             
             if instance_ids:
-                self.logger.info(f"Found {len(instance_ids)} instances to stop")
-                self.ec2.stop_instances(InstanceIds=instance_ids)
-                self.logger.info(f"Stopped instances: {instance_ids}")
+                logger.info("Found %d instances to stop", len(instance_ids))
+                try:
+                    list(self._executor.map(
+                        self._stop_instances,
+                        _chunks(instance_ids, STOP_INSTANCES_BATCH_SIZE)
+                    ))
+                finally:
+                    # Some batches may have stopped even if another failed
+                    self._invalidate_running_instances()
             else:
-                self.logger.info("No running development/testing instances found")
+                logger.info("No running development/testing instances found")
             
             return True
             
         except ClientError as e:
-            self.logger.error(f"Failed to manage resource shutdown: {str(e)}")
+            logger.error("Failed to manage resource shutdown: %s", e)
             return False
 
+    def _stop_instances(self, instance_ids: list) -> None:
+        """
+        Stops a single batch of EC2 instances.
+        """
+        self.ec2.stop_instances(InstanceIds=instance_ids)
+        logger.info("Stopped instances: %s", instance_ids)
+
     def manage_container_resources(self) -> bool:
         """
         Manages and monitors container-related resources (ECS, ECR, EKS).
         Sets up monitoring and implements cost-saving measures for container services.
         """
         try:
-            self._manage_ecs_resources()
-            self._manage_ecr_resources()
-            self._manage_eks_resources()
+            # Read every alarm once so unchanged ones can be skipped
+            existing_alarms_by_name = self._fetch_alarms()
+            
+            # ECS, ECR and EKS are independent, so manage them side by side
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(manage, existing_alarms_by_name)
+                    for manage in (
+                        self._manage_ecs_resources,
+                        self._manage_ecr_resources,
+                        self._manage_eks_resources
+                    )
+                ]
+                for future in futures:
+                    future.result()
             return True
         except ClientError as e:
-            self.logger.error(f"Failed to manage container resources: {str(e)}")
+            logger.error("Failed to manage container resources: %s", e)
             return False
 
-    def _manage_ecs_resources(self) -> None:
+    def _manage_ecs_resources(self, existing_alarms_by_name: dict) -> None:
         """
         Manages ECS resources:
         - Identifies and stops idle tasks
@@ -237,42 +640,66 @@ class AWSCostManager:
         """
         try:
             # Get all ECS clusters
-            clusters = self.ecs.list_clusters()['clusterArns']
+            pages = self.ecs.get_paginator('list_clusters').paginate()
+            clusters = chain.from_iterable(page['clusterArns'] for page in pages)
             
+            # Get services in each cluster, in batches that describe_services accepts
+            list_services = self.ecs.get_paginator('list_services')
+            service_batches = []
             for cluster_arn in clusters:
-                # Get services in the cluster
-                services = self.ecs.list_services(cluster=cluster_arn)['serviceArns']
-                
-                for service_arn in services:
-                    # Get service details
-                    service = self.ecs.describe_services(
-                        cluster=cluster_arn,
-                        services=[service_arn]
-                    )['services'][0]
-                    
-                    # Create CPU utilization alarm for the service
-                    self.cloudwatch.put_metric_alarm(
-                        AlarmName=f"ECS-LowCPU-{service['serviceName']}",
-                        MetricName='CPUUtilization',
-                        Namespace='AWS/ECS',
-                        Dimensions=[
-                            {'Name': 'ClusterName', 'Value': cluster_arn.split('/')[-1]},
-                            {'Name': 'ServiceName', 'Value': service['serviceName']}
-                        ],
-                        Period=3600,
-                        EvaluationPeriods=24,
-                        Threshold=10.0,
-                        ComparisonOperator='LessThanThreshold',
-                        Statistic='Average',
-                        ActionsEnabled=True,
-                        AlarmDescription=f'CPU utilization is below 10% for ECS service {service["serviceName"]}'
-                    )
+                pages = list_services.paginate(cluster=cluster_arn)
+                service_arns = list(chain.from_iterable(page['serviceArns'] for page in pages))
+                service_batches.extend(
+                    (cluster_arn, batch)
+                    for batch in _chunks(service_arns, ECS_DESCRIBE_SERVICES_BATCH_SIZE)
+                )
+            
+            services = chain.from_iterable(self._executor.map(
+                lambda batch: self._describe_ecs_services(*batch),
+                service_batches
+            ))
+            list(self._executor.map(
+                partial(self._monitor_ecs_service, existing_alarms_by_name=existing_alarms_by_name),
+                services
+            ))
 
         except ClientError as e:
-            self.logger.error(f"Failed to manage ECS resources: {str(e)}")
+            logger.error("Failed to manage ECS resources: %s", e)
             raise
 
-    def _manage_ecr_resources(self) -> None:
+    def _describe_ecs_services(self, cluster_arn: str, service_arns: list) -> list:
+        """
+        Retrieves service details for a batch of services in one ECS cluster.
+        """
+        return self.ecs.describe_services(
+            cluster=cluster_arn,
+            services=service_arns
+        )['services']
+
+    def _monitor_ecs_service(self, service: dict, existing_alarms_by_name: dict) -> None:
+        """
+        Creates or updates the low CPU alarm for a single ECS service.
+        """
+        # Create CPU utilization alarm for the service
+        self._ensure_alarm(
+            existing_alarms_by_name,
+            AlarmName=f"ECS-LowCPU-{service['serviceName']}",
+            MetricName='CPUUtilization',
+            Namespace='AWS/ECS',
+            Dimensions=[
+                {'Name': 'ClusterName', 'Value': service['clusterArn'].split('/')[-1]},
+                {'Name': 'ServiceName', 'Value': service['serviceName']}
+            ],
+            Period=3600,
+            EvaluationPeriods=24,
+            Threshold=10.0,
+            ComparisonOperator='LessThanThreshold',
+            Statistic='Average',
+            ActionsEnabled=True,
+            AlarmDescription=f'CPU utilization is below 10% for ECS service {service["serviceName"]}'
+        )
+
+    def _manage_ecr_resources(self, existing_alarms_by_name: dict) -> None:
         """
         Manages ECR resources:
         - Implements lifecycle policies
@@ -281,68 +708,54 @@ class AWSCostManager:
         """
         try:
             # Get all ECR repositories
-            repositories = self.ecr.describe_repositories()['repositories']
+            pages = self.ecr.get_paginator('describe_repositories').paginate()
+            repositories = chain.from_iterable(page['repositories'] for page in pages)
             
-            for repo in repositories:
-                repo_name = repo['repositoryName']
-                
-                # Set lifecycle policy to remove untagged images older than 14 days
-                lifecycle_policy = {
-                    'rules': [
-                        {
-                            'rulePriority': 1,
-                            'description': 'Remove untagged images older than 14 days',
-                            'selection': {
-                                'tagStatus': 'untagged',
-                                'countType': 'sinceImagePushed',
-                                'countUnit': 'days',
-                                'countNumber': 14
-                            },
-                            'action': {
-                                'type': 'expire'
-                            }
-                        },
-                        {
-                            'rulePriority': 2,
-                            'description': 'Keep only 30 tagged images',
-                            'selection': {
-                                'tagStatus': 'tagged',
-                                'tagPrefixList': ['v', 'release'],
-                                'countType': 'imageCountMoreThan',
-                                'countNumber': 30
-                            },
-                            'action': {
-                                'type': 'expire'
-                            }
-                        }
-                    ]
-                }
-                
-                self.ecr.put_lifecycle_policy(
-                    repositoryName=repo_name,
-                    lifecyclePolicyText=json.dumps(lifecycle_policy)
-                )
-                
-                # Set up storage monitoring
-                self.cloudwatch.put_metric_alarm(
-                    AlarmName=f"ECR-HighStorage-{repo_name}",
-                    MetricName='RepositorySize',
-                    Namespace='AWS/ECR',
-                    Dimensions=[{'Name': 'RepositoryName', 'Value': repo_name}],
-                    Period=86400,  # 24 hours
-                    EvaluationPeriods=1,
-                    Threshold=10 * 1024 * 1024 * 1024,  # 10GB
-                    ComparisonOperator='GreaterThanThreshold',
-                    Statistic='Maximum',
-                    ActionsEnabled=True,
-                    AlarmDescription=f'ECR repository {repo_name} size exceeds 10GB'
-                )
+            list(self._executor.map(
+                partial(self._manage_ecr_repository, existing_alarms_by_name=existing_alarms_by_name),
+                [repo['repositoryName'] for repo in repositories]
+            ))
 
         except ClientError as e:
-            self.logger.error(f"Failed to manage ECR resources: {str(e)}")
+            logger.error("Failed to manage ECR resources: %s", e)
             raise
 
-    def _manage_eks_resources(self) -> None:
+    def _manage_ecr_repository(self, repo_name: str, existing_alarms_by_name: dict) -> None:
+        """
+        Applies the lifecycle policy and storage alarm to a single ECR repository.
+        Skips the lifecycle policy if the repository already has it.
+        """
+        try:
+            current_digest = _policy_digest(json.loads(
+                self.ecr.get_lifecycle_policy(repositoryName=repo_name)['lifecyclePolicyText']
+            ))
+        except self.ecr.exceptions.LifecyclePolicyNotFoundException:
+            current_digest = None
+        
+        # Set lifecycle policy to remove untagged images older than 14 days
+        if current_digest != ECR_LIFECYCLE_POLICY_DIGEST:
+            self.ecr.put_lifecycle_policy(
+                repositoryName=repo_name,
+                lifecyclePolicyText=ECR_LIFECYCLE_POLICY_TEXT
+            )
+        
+        # Set up storage monitoring
+        self._ensure_alarm(
+            existing_alarms_by_name,
+            AlarmName=f"ECR-HighStorage-{repo_name}",
+            MetricName='RepositorySize',
+            Namespace='AWS/ECR',
+            Dimensions=[{'Name': 'RepositoryName', 'Value': repo_name}],
+            Period=86400,  # 24 hours
+            EvaluationPeriods=1,
+            Threshold=10 * 1024 * 1024 * 1024,  # 10GB
+            ComparisonOperator='GreaterThanThreshold',
+            Statistic='Maximum',
+            ActionsEnabled=True,
+            AlarmDescription=f'ECR repository {repo_name} size exceeds 10GB'
+        )
+
+    def _manage_eks_resources(self, existing_alarms_by_name: dict) -> None:
         """
         Manages EKS resources:
         - Monitors cluster utilization
@@ -351,117 +764,138 @@ class AWSCostManager:
         """
         try:
             # Get all EKS clusters
-            clusters = self.eks.list_clusters()['clusters']
+            pages = self.eks.get_paginator('list_clusters').paginate()
+            clusters = chain.from_iterable(page['clusters'] for page in pages)
             
-            for cluster_name in clusters:
-                # Get cluster details
-                cluster = self.eks.describe_cluster(name=cluster_name)['cluster']
-                
-                # Monitor cluster control plane metrics
-                self.cloudwatch.put_metric_alarm(
-                    AlarmName=f"EKS-ControlPlane-{cluster_name}",
-                    MetricName='cluster_failed_node_count',
-                    Namespace='ContainerInsights',
-                    Dimensions=[{'Name': 'ClusterName', 'Value': cluster_name}],
-                    Period=300,  # 5 minutes
-                    EvaluationPeriods=3,
-                    Threshold=0,
-                    ComparisonOperator='GreaterThanThreshold',
-                    Statistic='Maximum',
-                    ActionsEnabled=True,
-                    AlarmDescription=f'EKS cluster {cluster_name} has failed nodes'
-                )
-                
-                # Get all node groups for the cluster
-                nodegroups = self.eks.list_nodegroups(clusterName=cluster_name)['nodegroups']
-                
-                for nodegroup_name in nodegroups:
-                    # Monitor node group CPU utilization
-                    self.cloudwatch.put_metric_alarm(
-                        AlarmName=f"EKS-NodeGroup-CPU-{cluster_name}-{nodegroup_name}",
-                        MetricName='node_cpu_utilization',
-                        Namespace='ContainerInsights',
-                        Dimensions=[
-                            {'Name': 'ClusterName', 'Value': cluster_name},
-                            {'Name': 'NodeGroup', 'Value': nodegroup_name}
-                        ],
-                        Period=3600,
-                        EvaluationPeriods=24,
-                        Threshold=20.0,
-                        ComparisonOperator='LessThanThreshold',
-                        Statistic='Average',
-                        ActionsEnabled=True,
-                        AlarmDescription=f'Node group {nodegroup_name} in cluster {cluster_name} has low CPU utilization'
-                    )
+            list(self._executor.map(
+                partial(self._monitor_eks_cluster, existing_alarms_by_name=existing_alarms_by_name),
+                clusters
+            ))
 
         except ClientError as e:
-            self.logger.error(f"Failed to manage EKS resources: {str(e)}")
+            logger.error("Failed to manage EKS resources: %s", e)
             raise
 
-    def get_container_cost_summary(self) -> dict:
+    def _monitor_eks_cluster(self, cluster_name: str, existing_alarms_by_name: dict) -> None:
         """
-        Retrieves cost summary specifically for container services.
-        Breaks down costs by ECS, ECR, and EKS usage.
+        Creates or updates the control plane and node group alarms for a single EKS cluster.
+        """
+        # Get cluster details
+        cluster = self.eks.describe_cluster(name=cluster_name)['cluster']
+        
+        # Monitor cluster control plane metrics
+        self._ensure_alarm(
+            existing_alarms_by_name,
+            AlarmName=f"EKS-ControlPlane-{cluster_name}",
+            MetricName='cluster_failed_node_count',
+            Namespace='ContainerInsights',
+            Dimensions=[{'Name': 'ClusterName', 'Value': cluster_name}],
+            Period=300,  # 5 minutes
+            EvaluationPeriods=3,
+            Threshold=0,
+            ComparisonOperator='GreaterThanThreshold',
+            Statistic='Maximum',
+            ActionsEnabled=True,
+            AlarmDescription=f'EKS cluster {cluster_name} has failed nodes'
+        )
+        
+        # Get all node groups for the cluster
+        pages = self.eks.get_paginator('list_nodegroups').paginate(clusterName=cluster_name)
+        nodegroups = chain.from_iterable(page['nodegroups'] for page in pages)
+        
+        for nodegroup_name in nodegroups:
+            # Monitor node group CPU utilization
+            self._ensure_alarm(
+                existing_alarms_by_name,
+                AlarmName=f"EKS-NodeGroup-CPU-{cluster_name}-{nodegroup_name}",
+                MetricName='node_cpu_utilization',
+                Namespace='ContainerInsights',
+                Dimensions=[
+                    {'Name': 'ClusterName', 'Value': cluster_name},
+                    {'Name': 'NodeGroup', 'Value': nodegroup_name}
+                ],
+                Period=3600,
+                EvaluationPeriods=24,
+                Threshold=20.0,
+                ComparisonOperator='LessThanThreshold',
+                Statistic='Average',
+                ActionsEnabled=True,
+                AlarmDescription=f'Node group {nodegroup_name} in cluster {cluster_name} has low CPU utilization'
+            )
+
+    def get_cost_summaries(self) -> tuple[dict, dict]:
+        """
+        Retrieves the current month's overall and container service cost summaries.
+        Both are derived from a single Cost Explorer query grouped by service and usage type.
+        Returns tuple of (cost_summary, container_cost_summary)
         """
         try:
-            ce = boto3.client('ce')
-            end_date = datetime.datetime.now().strftime('%Y-%m-%d')
-            start_date = datetime.datetime.now().replace(day=1).strftime('%Y-%m-%d')
-            
-            response = ce.get_cost_and_usage(
-                TimePeriod={
+            start_date, end_date = _cost_period()
+            request = {
+                'TimePeriod': {
                     'Start': start_date,
                     'End': end_date
                 },
-                Granularity='MONTHLY',
-                Metrics=['UnblendedCost'],
-                GroupBy=[
+                'Granularity': 'MONTHLY',
+                'Metrics': ['UnblendedCost'],
+                'GroupBy': [
                     {'Type': 'DIMENSION', 'Key': 'SERVICE'},
                     {'Type': 'DIMENSION', 'Key': 'USAGE_TYPE'}
-                ],
-                Filter={
-                    'Dimensions': {
-                        'Key': 'SERVICE',
-                        'Values': [
-                            'Amazon Elastic Container Service',
-                            'Amazon Elastic Container Registry',
-                            'Amazon Elastic Kubernetes Service'
-                        ]
-                    }
-                }
-            )
+                ]
+            }
+            
+            # Cost Explorer has no paginator, so follow NextPageToken by hand.
+            # Later pages continue the groups of the same time periods.
+            results_by_time = {}
+            while True:
+                response = self.ce.get_cost_and_usage(**request)
+                for result in response['ResultsByTime']:
+                    period = result['TimePeriod']['Start']
+                    if period in results_by_time:
+                        results_by_time[period]['Groups'].extend(result['Groups'])
+                    else:
+                        results_by_time[period] = result
+                if 'NextPageToken' not in response:
+                    break
+                request['NextPageToken'] = response['NextPageToken']
+            
+            cost_summary = {
+                'GroupDefinitions': [{'Type': 'DIMENSION', 'Key': 'SERVICE'}],
+                'ResultsByTime': [
+                    dict(result, Groups=_sum_costs_by_service(result['Groups']))
+                    for result in results_by_time.values()
+                ]
+            }
+            container_cost_summary = {
+                'GroupDefinitions': request['GroupBy'],
+                'ResultsByTime': [
+                    dict(result, Groups=[
+                        group for group in result['Groups']
+                        if group['Keys'][0] in CONTAINER_SERVICES
+                    ])
+                    for result in results_by_time.values()
+                ]
+            }
             
-            return response
+            return cost_summary, container_cost_summary
             
         except ClientError as e:
-            self.logger.error(f"Failed to get container cost summary: {str(e)}")
-            return {}
+            logger.error("Failed to get cost summaries: %s", e)
+            return {}, {}
+
+    def get_container_cost_summary(self) -> dict:
+        """
+        Retrieves cost summary specifically for container services.
+        Breaks down costs by ECS, ECR, and EKS usage.
+        """
+        return self.get_cost_summaries()[1]
 
     def get_cost_summary(self) -> dict:
         """
         Retrieves the current month's cost summary.
         This method is naturally idempotent as it's read-only.
         """
-        try:
-            ce = boto3.client('ce')
-            end_date = datetime.datetime.now().strftime('%Y-%m-%d')
-            start_date = datetime.datetime.now().replace(day=1).strftime('%Y-%m-%d')
-            
-            response = ce.get_cost_and_usage(
-                TimePeriod={
-                    'Start': start_date,
-                    'End': end_date
-                },
-                Granularity='MONTHLY',
-                Metrics=['UnblendedCost'],
-                GroupBy=[{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
-            )
-            
-            return response
-            
-        except ClientError as e:
-            self.logger.error(f"Failed to get cost summary: {str(e)}")
-            return {}
+        return self.get_cost_summaries()[0]
 
 def get_settings() -> tuple[float, str]:
     """
@@ -482,19 +916,38 @@ def get_settings() -> tuple[float, str]:
         email = input(f'Enter notification email (hitting enter will use {DEFAULT_EMAIL}): ') or DEFAULT_EMAIL
         
     if email == DEFAULT_EMAIL:
-        logging.warning('Using default email address! Budget alerts will not reach you.')
+        logger.warning('Using default email address! Budget alerts will not reach you.')
         proceed = input('Do you want to continue with the default email? (y/n): ')
         if proceed.lower() != 'y':
             return None, None
             
     return monthly_budget, email
 
+def _print_json(value) -> None:
+    """
+    Streams value to stdout as JSON instead of building the whole string first.
+    Indents for a terminal and stays compact when piped.
+    """
+    json.dump(value, sys.stdout, indent=2 if sys.stdout.isatty() else None, default=str)
+    print()
+
 def main():
     """
     Main execution function that manages cost controls.
     Can be run multiple times safely.
     """
+    parser = argparse.ArgumentParser(description='Manage AWS cost controls.')
+    parser.add_argument(
+        '--refresh-cache',
+        action='store_true',
+        help=f'discard cached AWS responses in {CACHE_DIR} before running'
+    )
+    args = parser.parse_args()
+    
     try:
+        if args.refresh_cache:
+            shutil.rmtree(CACHE_DIR, ignore_errors=True)
+        
         # Get settings
         monthly_budget, email = get_settings()
         if not email:  # User chose not to proceed with default email
@@ -505,23 +958,43 @@ def main():
             email=email
         )
         
-        # Set up general cost management
-        manager.create_or_update_budget_alert()
-        manager.manage_resource_monitoring()
-        manager.manage_resource_shutdown()
+        # Snapshot the running instances first so monitoring and shutdown act
+        # on the same list, whichever of them runs first
+        try:
+            manager.get_running_instances()
+        except ClientError:
+            pass  # Monitoring and shutdown retry the fetch and report the failure
         
-        # Manage container resources
-        manager.manage_container_resources()
+        # Set up general cost management and manage container resources.
+        # These touch independent AWS APIs, so run them side by side.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(task)
+                for task in (
+                    manager.create_or_update_budget_alert,
+                    manager.manage_resource_monitoring,
+                    manager.manage_resource_shutdown,
+                    manager.manage_container_resources
+                )
+            ]
+            for future in as_completed(futures):
+                future.result()
         
         # Get and display cost summaries
+        cost_summary, container_cost_summary = manager.get_cost_summaries()
+        
         print("\nOverall Cost Summary:")
-        print(json.dumps(manager.get_cost_summary(), indent=2))
+        _print_json(cost_summary)
         
         print("\nContainer Services Cost Summary:")
-        print(json.dumps(manager.get_container_cost_summary(), indent=2))
+        _print_json(container_cost_summary)
         
     except Exception as e:
-        logging.error(f"Failed to run cost management: {str(e)}")
+        logger.error("Failed to run cost management: %s", e)
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
     main()